@@ -19,13 +19,18 @@ DEFAULTDATA : DecayData
 
 from pathlib import Path
 import pickle
+import sys
 from typing import ContextManager, Union
 import numpy as np
 from scipy import sparse
 from sympy import log, Matrix
 from sympy.core.numbers import Rational
 from sympy.matrices import SparseMatrix
-from radioactivedecay.utils import parse_nuclide, parse_radionuclide, time_unit_conv
+from radioactivedecay.utils import (
+    _parse_radionuclide_index,
+    parse_nuclide,
+    time_unit_conv,
+)
 
 try:
     from importlib import resources
@@ -102,6 +107,50 @@ def _csr_matrix_equal(matrix_a: sparse.csr_matrix, matrix_b: sparse.csr_matrix)
     )
 
 
+def _half_life_in_units(
+    half_life: float, unit: str, readable_str: str, units: str, year_conv: float
+) -> Union[float, str]:
+    """
+    Returns a half-life from the decay dataset in the requested units, or as a human-readable
+    string.
+
+    Parameters
+    ----------
+    half_life : float
+        Half-life as listed in the decay dataset.
+    unit : str
+        Time unit of the half-life as listed in the decay dataset.
+    readable_str : str
+        Human-readable half-life string from the decay dataset.
+    units : str
+        Units requested for the half-life, or 'readable' for the human-readable string.
+    year_conv : float
+        Conversion factor for number of days in a year.
+
+    Returns
+    -------
+    float or str
+        Half-life in the requested units, or the human-readable string.
+
+    Raises
+    ------
+    ValueError
+        If the requested units are invalid.
+
+    """
+
+    if units == "readable":
+        return readable_str
+
+    return (
+        half_life
+        if unit == units
+        else time_unit_conv(
+            half_life, units_from=unit, units_to=units, year_conv=year_conv
+        )
+    )
+
+
 class DecayMatrices:
     """
     Instances of DecayMatrices store matrices and vectors used for decay calculations, and the
@@ -268,7 +317,10 @@ class DecayData:
 
         self.num_radionuclides = self.radionuclides.size
         self.radionuclide_dict = dict(
-            zip(self.radionuclides, list(range(0, self.num_radionuclides)))
+            zip(
+                map(sys.intern, self.radionuclides.tolist()),
+                range(self.num_radionuclides),
+            )
         )
 
         decay_consts = np.array(
@@ -295,6 +347,11 @@ class DecayData:
             decay_consts, matrix_c, matrix_c_inv, data["year_conv"]
         )
 
+        # Tuple copies of per-radionuclide data for fast indexing in Radionuclide.__init__().
+        self._hldata_tuple = tuple(map(tuple, self.hldata.tolist()))
+        self._decay_consts_tuple = tuple(decay_consts.tolist())
+        self._prog_bfs_modes_tuple = tuple(self.prog_bfs_modes.tolist())
+
         if load_sympy:
             if dir_path is None:
                 decay_consts = _get_package_pickle(
@@ -351,25 +408,13 @@ class DecayData:
 
         """
 
-        radionuclide = parse_radionuclide(
-            radionuclide, self.radionuclides, self.dataset
+        _, idx = _parse_radionuclide_index(
+            radionuclide, self.radionuclide_dict, self.dataset
         )
-        half_life, unit, readable_str = self.hldata[
-            self.radionuclide_dict[radionuclide]
-        ]
-
-        if units == "readable":
-            return readable_str
+        half_life, unit, readable_str = self.hldata[idx]
 
-        return (
-            half_life
-            if unit == units
-            else time_unit_conv(
-                half_life,
-                units_from=unit,
-                units_to=units,
-                year_conv=self.scipy_data.year_conv,
-            )
+        return _half_life_in_units(
+            half_life, unit, readable_str, units, self.scipy_data.year_conv
         )
 
     def branching_fraction(self, parent: str, progeny: str) -> float:
@@ -395,10 +440,10 @@ class DecayData:
 
         """
 
-        parent = parse_radionuclide(parent, self.radionuclides, self.dataset)
-        progeny = parse_nuclide(progeny)
-        if progeny in self.prog_bfs_modes[self.radionuclide_dict[parent]]:
-            return self.prog_bfs_modes[self.radionuclide_dict[parent]][progeny][0]
+        _, idx = _parse_radionuclide_index(parent, self.radionuclide_dict, self.dataset)
+        bf_mode = self.prog_bfs_modes[idx].get(parse_nuclide(progeny))
+        if bf_mode is not None:
+            return bf_mode[0]
 
         return 0.0
 
@@ -428,10 +473,10 @@ class DecayData:
 
         """
 
-        parent = parse_radionuclide(parent, self.radionuclides, self.dataset)
-        progeny = parse_nuclide(progeny)
-        if progeny in self.prog_bfs_modes[self.radionuclide_dict[parent]]:
-            return self.prog_bfs_modes[self.radionuclide_dict[parent]][progeny][1]
+        _, idx = _parse_radionuclide_index(parent, self.radionuclide_dict, self.dataset)
+        bf_mode = self.prog_bfs_modes[idx].get(parse_nuclide(progeny))
+        if bf_mode is not None:
+            return bf_mode[1]
 
         return ""
 
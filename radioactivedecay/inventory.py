@@ -17,7 +17,7 @@ as:
 """
 
 from functools import singledispatch, update_wrapper
-from typing import Callable, Dict, List, Tuple, Union
+from typing import Callable, Container, Dict, List, Tuple, Union
 from sympy import exp, nsimplify
 from radioactivedecay.decaydata import DecayData, DEFAULTDATA, np
 from radioactivedecay.plots import _decay_graph, matplotlib
@@ -100,7 +100,7 @@ def _sort_dictionary_alphabetically(
 
 def _check_dictionary(
     input_inv_dict: Dict[Union[str, Radionuclide], float],
-    radionuclides: List[str],
+    radionuclides: Container[str],
     dataset: str,
 ) -> Dict[str, float]:
     """
@@ -112,8 +112,9 @@ def _check_dictionary(
     input_inv_dict : dict
         Dictionary containing radionuclide strings or Radionuclide objects as keys and activities
         as values.
-    radionuclides : List[str]
-        List of all the radionuclides in the decay dataset.
+    radionuclides : Container[str]
+        Container of all the radionuclides in the decay dataset. A hashed container such as
+        ``DecayData.radionuclide_dict`` gives the fastest membership checks.
     dataset : str
         Name of the decay dataset.
 
@@ -130,10 +131,10 @@ def _check_dictionary(
 
     Examples
     --------
-    >>> rd.inventory._check_dictionary({'3H': 1.0}, rd.DEFAULTDATA.radionuclides, rd.DEFAULTDATA.dataset)
+    >>> rd.inventory._check_dictionary({'3H': 1.0}, rd.DEFAULTDATA.radionuclide_dict, rd.DEFAULTDATA.dataset)
     {'H-3': 1.0}
     >>> H3 = rd.Radionuclide('H-3')
-    >>> rd.inventory._check_dictionary({H3: 1.0}, rd.DEFAULTDATA.radionuclides, rd.DEFAULTDATA.dataset)
+    >>> rd.inventory._check_dictionary({H3: 1.0}, rd.DEFAULTDATA.radionuclide_dict, rd.DEFAULTDATA.dataset)
     {'H-3': 1.0}
 
     """
@@ -250,7 +251,7 @@ class Inventory:
         """
 
         parsed_contents: Dict[str, float] = _check_dictionary(
-            contents, data.radionuclides, data.dataset
+            contents, data.radionuclide_dict, data.dataset
         ) if check is True else contents
         self.contents: Dict[str, float] = _sort_dictionary_alphabetically(
             parsed_contents
@@ -312,7 +313,7 @@ class Inventory:
         """
 
         parsed_add_contents: Dict[str, float] = _check_dictionary(
-            add_contents, self.data.radionuclides, self.data.dataset
+            add_contents, self.data.radionuclide_dict, self.data.dataset
         )
         new_contents = _add_dictionaries(self.contents, parsed_add_contents)
         self._change(new_contents, False, self.data)
@@ -336,7 +337,7 @@ class Inventory:
 
         """
         parsed_sub_contents: Dict[str, float] = _check_dictionary(
-            sub_contents, self.data.radionuclides, self.data.dataset
+            sub_contents, self.data.radionuclide_dict, self.data.dataset
         )
         parsed_sub_contents.update(
             (nuclide, radioactivity * -1.0)
@@ -436,7 +437,9 @@ class Inventory:
     def _(self, delete: str) -> Callable[[Dict[str, float], bool, DecayData], None]:
         """Remove radionuclide string from this inventory."""
 
-        delete = parse_radionuclide(delete, self.data.radionuclides, self.data.dataset)
+        delete = parse_radionuclide(
+            delete, self.data.radionuclide_dict, self.data.dataset
+        )
         new_contents = self.contents.copy()
         if delete not in new_contents:
             raise ValueError(delete + " does not exist in this inventory.")
@@ -450,7 +453,7 @@ class Inventory:
         """Remove radionuclide object from this inventory."""
 
         delete = parse_radionuclide(
-            delete.radionuclide, self.data.radionuclides, self.data.dataset
+            delete.radionuclide, self.data.radionuclide_dict, self.data.dataset
         )
         new_contents = self.contents.copy()
         if delete not in new_contents:
@@ -466,10 +469,10 @@ class Inventory:
 
         delete = [
             parse_radionuclide(
-                nuc.radionuclide, self.data.radionuclides, self.data.dataset
+                nuc.radionuclide, self.data.radionuclide_dict, self.data.dataset
             )
             if isinstance(nuc, Radionuclide)
-            else parse_radionuclide(nuc, self.data.radionuclides, self.data.dataset)
+            else parse_radionuclide(nuc, self.data.radionuclide_dict, self.data.dataset)
             for nuc in delete
         ]
         new_contents = self.contents.copy()
@@ -527,6 +530,7 @@ class Inventory:
                 raise ValueError("No SymPy data in decay dataset " + self.data.dataset)
             return self._decay_sympy(decay_time, units, sig_fig)
 
+        scipy_data = self.data.scipy_data
         decay_time = (
             decay_time
             if units == "s"
@@ -534,32 +538,26 @@ class Inventory:
                 decay_time,
                 units_from=units,
                 units_to="s",
-                year_conv=self.data.scipy_data.year_conv,
+                year_conv=scipy_data.year_conv,
             )
         )
 
-        vector_n0 = self.data.scipy_data.vector_n0.copy()
+        radionuclide_dict = self.data.radionuclide_dict
+        decay_consts = scipy_data.decay_consts
+        matrix_c = scipy_data.matrix_c
+        vector_n0 = scipy_data.vector_n0.copy()
         indices_set = set()
-        for radionuclide in self.contents:
-            i = self.data.radionuclide_dict[radionuclide]
-            vector_n0[i] = (
-                self.contents[radionuclide] / self.data.scipy_data.decay_consts[i]
-            )
-            indices_set.update(self.data.scipy_data.matrix_c[:, i].nonzero()[0])
+        for radionuclide, activity in self.contents.items():
+            i = radionuclide_dict[radionuclide]
+            vector_n0[i] = activity / decay_consts[i]
+            indices_set.update(matrix_c[:, i].nonzero()[0])
         indices = list(indices_set)
 
-        matrix_e = self.data.scipy_data.matrix_e.copy()
-        matrix_e.data[indices] = np.exp(
-            -decay_time * self.data.scipy_data.decay_consts[indices]
-        )
+        matrix_e = scipy_data.matrix_e.copy()
+        matrix_e.data[indices] = np.exp(-decay_time * decay_consts[indices])
 
-        vector_nt = (
-            self.data.scipy_data.matrix_c
-            @ matrix_e
-            @ self.data.scipy_data.matrix_c_inv
-            @ vector_n0
-        )
-        vector_at = vector_nt[indices] * self.data.scipy_data.decay_consts[indices]
+        vector_nt = matrix_c @ matrix_e @ scipy_data.matrix_c_inv @ vector_n0
+        vector_at = vector_nt[indices] * decay_consts[indices]
 
         new_contents = _sort_dictionary_alphabetically(
             dict(zip(self.data.radionuclides[indices], vector_at))
@@ -864,7 +862,7 @@ class Inventory:
             if isinstance(display, str):
                 display = [display]
             display = [
-                parse_radionuclide(rad, self.data.radionuclides, self.data.dataset)
+                parse_radionuclide(rad, self.data.radionuclide_dict, self.data.dataset)
                 for rad in display
             ]
 
@@ -14,9 +14,9 @@ as:
 
 """
 
-from typing import Dict, List, Union
-from radioactivedecay.decaydata import DecayData, DEFAULTDATA
-from radioactivedecay.utils import parse_radionuclide
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from radioactivedecay.decaydata import _half_life_in_units, DecayData, DEFAULTDATA
+from radioactivedecay.utils import _parse_radionuclide_index
 
 
 class Radionuclide:
@@ -35,6 +35,8 @@ class Radionuclide:
     ----------
     radionuclide : str
         Radionuclide string.
+    decay_constant : float
+        Decay constant of the radionuclide (s\\ :sup:`-1`).
     prog_bf_mode : dict
         Dictionary containing direct progeny as keys, and a list containing the branching fraction
         and the decay mode for that progeny as values.
@@ -48,15 +50,108 @@ class Radionuclide:
 
     """
 
+    __slots__ = (
+        "radionuclide",
+        "decay_constant",
+        "prog_bf_mode",
+        "data",
+        "_half_life",
+        "_half_life_units",
+        "_half_life_readable",
+        "_half_life_seconds",
+        "_half_life_cache",
+        "_progeny",
+        "_bfs",
+        "_modes",
+    )
+
     def __init__(self, radionuclide: str, data: DecayData = DEFAULTDATA) -> None:
-        self.radionuclide: str = parse_radionuclide(
-            radionuclide, data.radionuclides, data.dataset
+        radionuclide, idx = _parse_radionuclide_index(
+            radionuclide, data.radionuclide_dict, data.dataset
         )
-        self.prog_bf_mode: Dict[str, List] = data.prog_bfs_modes[
-            data.radionuclide_dict[self.radionuclide]
-        ]
+        self._init_from_index(radionuclide, idx, data)
+
+    def _init_from_index(self, radionuclide: str, idx: int, data: DecayData) -> None:
+        """
+        Sets the instance attributes from an already parsed radionuclide string and its position
+        in the decay dataset.
+        """
+
+        # pylint: disable=protected-access
+
+        self.radionuclide: str = radionuclide
+        self.decay_constant: float = data._decay_consts_tuple[idx]
+        self.prog_bf_mode: Dict[str, List] = data._prog_bfs_modes_tuple[idx]
         self.data: DecayData = data
 
+        (
+            self._half_life,
+            self._half_life_units,
+            self._half_life_readable,
+        ) = data._hldata_tuple[idx]
+        self._half_life_seconds: float = _half_life_in_units(
+            self._half_life,
+            self._half_life_units,
+            self._half_life_readable,
+            "s",
+            data.scipy_data.year_conv,
+        )
+
+        self._progeny: Optional[Tuple[str, ...]] = None
+        self._bfs: Optional[Tuple[float, ...]] = None
+        self._modes: Optional[Tuple[str, ...]] = None
+        self._half_life_cache: Optional[Dict[str, Union[float, str]]] = None
+
+    @classmethod
+    def many(
+        cls, radionuclides: Iterable[str], data: DecayData = DEFAULTDATA
+    ) -> List["Radionuclide"]:
+        """
+        Returns a list of ``Radionuclide`` instances, one for each radionuclide string supplied.
+        Equivalent to ``[cls(radionuclide, data) for radionuclide in radionuclides]``, but the
+        decay dataset attributes are looked up once for the whole batch rather than per instance.
+
+        Note: instances are created with ``cls.__new__()`` and initialized directly, so any
+        ``__init__()`` defined by a subclass of ``Radionuclide`` is not called.
+
+        Parameters
+        ----------
+        radionuclides : iterable of str
+            Radionuclide strings.
+        data : DecayData, optional
+            Decay dataset (default is the ICRP-107 dataset).
+
+        Returns
+        -------
+        list
+            List of ``Radionuclide`` instances, in the same order as the input strings.
+
+        Raises
+        ------
+        ValueError
+            If any of the radionuclide strings is invalid or not contained in the decay dataset.
+
+        Examples
+        --------
+        >>> rd.Radionuclide.many(['K-40', '222Rn'])
+        [Radionuclide: K-40, decay dataset: icrp107, Radionuclide: Rn-222, decay dataset: icrp107]
+
+        """
+
+        dataset = data.dataset
+        radionuclide_dict = data.radionuclide_dict
+
+        instances = []
+        for radionuclide in radionuclides:
+            radionuclide, idx = _parse_radionuclide_index(
+                radionuclide, radionuclide_dict, dataset
+            )
+            instance = cls.__new__(cls)
+            instance._init_from_index(radionuclide, idx, data)
+            instances.append(instance)
+
+        return instances
+
     def half_life(self, units: str = "s") -> Union[float, str]:
         """
         Returns the half-life of the radionuclide as a float in your chosen units, or as
@@ -82,7 +177,23 @@ class Radionuclide:
 
         """
 
-        return self.data.half_life(self.radionuclide, units)
+        if units == "s":
+            return self._half_life_seconds
+
+        if self._half_life_cache is None:
+            self._half_life_cache = {}
+        half_life = self._half_life_cache.get(units)
+        if half_life is None:
+            half_life = _half_life_in_units(
+                self._half_life,
+                self._half_life_units,
+                self._half_life_readable,
+                units,
+                self.data.scipy_data.year_conv,
+            )
+            self._half_life_cache[units] = half_life
+
+        return half_life
 
     def progeny(self) -> List[str]:
         """
@@ -92,7 +203,7 @@ class Radionuclide:
         -------
         list
             List of the direct progeny of the radionuclide, ordered by decreasing branching
-            fraction.
+            fraction. A new list is returned on each call.
 
         Examples
         --------
@@ -102,7 +213,9 @@ class Radionuclide:
 
         """
 
-        return list(self.prog_bf_mode.keys())
+        if self._progeny is None:
+            self._progeny = tuple(self.prog_bf_mode)
+        return list(self._progeny)
 
     def branching_fractions(self) -> List[float]:
         """
@@ -111,7 +224,7 @@ class Radionuclide:
         Returns
         -------
         list
-            List of branching fractions.
+            List of branching fractions. A new list is returned on each call.
 
         Examples
         --------
@@ -121,7 +234,9 @@ class Radionuclide:
 
         """
 
-        return [bf_mode[0] for bf_mode in list(self.prog_bf_mode.values())]
+        if self._bfs is None:
+            self._bfs = tuple(bf_mode[0] for bf_mode in self.prog_bf_mode.values())
+        return list(self._bfs)
 
     def decay_modes(self) -> List[str]:
         """
@@ -133,7 +248,7 @@ class Radionuclide:
         Returns
         -------
         list
-            List of decay modes.
+            List of decay modes. A new list is returned on each call.
 
         Examples
         --------
@@ -143,15 +258,12 @@ class Radionuclide:
 
         """
 
-        return [bf_mode[1] for bf_mode in list(self.prog_bf_mode.values())]
+        if self._modes is None:
+            self._modes = tuple(bf_mode[1] for bf_mode in self.prog_bf_mode.values())
+        return list(self._modes)
 
     def __repr__(self) -> str:
-        return (
-            "Radionuclide: "
-            + str(self.radionuclide)
-            + ", decay dataset: "
-            + self.data.dataset
-        )
+        return f"Radionuclide: {self.radionuclide}, decay dataset: {self.data.dataset}"
 
     def __eq__(self, other) -> bool:
         """
@@ -11,14 +11,17 @@ as:
 
 """
 
-from typing import List
+from functools import lru_cache
+import sys
+from typing import Container, Optional, Tuple
 from sympy import Integer, Rational
 
 
 def parse_nuclide(nuclide: str) -> str:
     """
     Parses a nuclide string from e.g. '241Pu' or 'Pu241' format to 'Pu-241' format. Not this
-    function works for both radioactive and stable nuclides.
+    function works for both radioactive and stable nuclides. Results for strings are memoized, as
+    the same nuclide strings tend to be parsed many times.
 
     Parameters
     ----------
@@ -39,6 +42,19 @@ def parse_nuclide(nuclide: str) -> str:
 
     """
 
+    if isinstance(nuclide, str):
+        return _parse_nuclide(nuclide)
+    return _parse_nuclide.__wrapped__(nuclide)
+
+
+@lru_cache(maxsize=4096)
+def _parse_nuclide(nuclide: str) -> str:
+    """
+    Memoized implementation of ``parse_nuclide()``. Only call with ``str`` arguments, as the
+    ``lru_cache`` requires hashable inputs. Unhashable inputs should be passed to the uncached
+    ``_parse_nuclide.__wrapped__``, which raises the usual ValueError for invalid inputs.
+    """
+
     letter_flag, number_flag = False, False
     for char in nuclide:
         if char.isalpha():
@@ -66,7 +82,7 @@ def parse_nuclide(nuclide: str) -> str:
 
 
 def parse_radionuclide(
-    radionuclide: str, radionuclides: List[str], dataset: str
+    radionuclide: str, radionuclides: Container[str], dataset: str
 ) -> str:
     """
     Parses a radionuclide string into symbol - mass number format and checks whether the
@@ -76,8 +92,9 @@ def parse_radionuclide(
     ----------
     radionuclide : str
         Radionuclide string.
-    radionuclides : List[str]
-        List of all the radionuclides in the decay dataset.
+    radionuclides : Container[str]
+        Container of all the radionuclides in the decay dataset. A hashed container such as
+        ``DecayData.radionuclide_dict`` gives the fastest membership checks.
     dataset : str
         Name of the decay dataset.
 
@@ -94,25 +111,133 @@ def parse_radionuclide(
 
     Examples
     --------
-    >>> rd.utils.parse_radionuclide('222Rn', rd.DEFAULTDATA.radionuclides, rd.DEFAULTDATA.dataset)
+    >>> rd.utils.parse_radionuclide('222Rn', rd.DEFAULTDATA.radionuclide_dict, rd.DEFAULTDATA.dataset)
     'Rn-222'
-    >>> rd.utils.parse_radionuclide('Ba137m', rd.DEFAULTDATA.radionuclides, rd.DEFAULTDATA.dataset)
+    >>> rd.utils.parse_radionuclide('Ba137m', rd.DEFAULTDATA.radionuclide_dict, rd.DEFAULTDATA.dataset)
     'Ba-137m'
 
     """
 
-    original_radionuclide = radionuclide
-    radionuclide = parse_nuclide(radionuclide)
+    return _parse_radionuclide_index(radionuclide, radionuclides, dataset)[0]
 
-    if radionuclide not in radionuclides:
-        raise ValueError(
-            str(original_radionuclide)
-            + " is not a valid radionuclide in "
-            + dataset
-            + " dataset."
-        )
 
-    return radionuclide
+def _parse_radionuclide_index(
+    radionuclide: str, radionuclides: Container[str], dataset: str
+) -> Tuple[str, Optional[int]]:
+    """
+    Implementation of ``parse_radionuclide()`` which also returns the position of the radionuclide
+    in the decay dataset. When radionuclides is a dictionary with positions as values (i.e.
+    ``DecayData.radionuclide_dict``), the check and the position need only a single dictionary
+    lookup. For other containers the position returned is None.
+
+    Parameters
+    ----------
+    radionuclide : str
+        Radionuclide string.
+    radionuclides : Container[str]
+        Container of all the radionuclides in the decay dataset, or dictionary containing
+        radionuclide strings as keys and positions in the decay dataset as values.
+    dataset : str
+        Name of the decay dataset.
+
+    Returns
+    -------
+    str
+        Interned radionuclide string parsed in symbol - mass number format.
+    int or None
+        Position of the radionuclide in the decay dataset, or None if radionuclides is not a
+        dictionary.
+
+    Raises
+    ------
+    ValueError
+        If the radionuclide string is invalid or the radionuclide is not contained in the decay
+        dataset.
+
+    """
+
+    parsed = sys.intern(str(parse_nuclide(radionuclide)))
+
+    if isinstance(radionuclides, dict):
+        try:
+            return parsed, radionuclides[parsed]
+        except KeyError:
+            pass
+    elif parsed in radionuclides:
+        return parsed, None
+
+    raise ValueError(
+        str(radionuclide) + " is not a valid radionuclide in " + dataset + " dataset."
+    )
+
+
+_SECONDS_PER_UNIT = {
+    "ps": 1.0e-12,
+    "ns": 1.0e-9,
+    "μs": 1.0e-6,
+    "us": 1.0e-6,
+    "ms": 1.0e-3,
+    "s": 1.0,
+    "m": 60.0,
+    "h": 3600.0,
+    "d": 86400.0,
+    "sec": 1.0,
+    "second": 1.0,
+    "seconds": 1.0,
+    "hr": 3600.0,
+    "hour": 3600.0,
+    "hours": 3600.0,
+    "day": 86400.0,
+    "days": 86400.0,
+}
+
+_YEARS_PER_UNIT = {
+    "y": 1.0,
+    "yr": 1.0,
+    "year": 1.0,
+    "years": 1.0,
+    "ky": 1.0e3,
+    "My": 1.0e6,
+    "By": 1.0e9,
+    "Gy": 1.0e9,
+    "Ty": 1.0e12,
+    "Py": 1.0e15,
+}
+
+
+def _time_unit_factor(units: str, year_conv: float) -> float:
+    """
+    Returns the conversion factor from a time unit to seconds.
+
+    Parameters
+    ----------
+    units : str
+        Time unit.
+    year_conv : float
+        Conversion factor for number of days in a year.
+
+    Returns
+    -------
+    float
+        Number of seconds per time unit.
+
+    Raises
+    ------
+    ValueError
+        If the time unit is invalid.
+
+    """
+
+    factor = _SECONDS_PER_UNIT.get(units)
+    if factor is not None:
+        return factor
+    factor = _YEARS_PER_UNIT.get(units)
+    if factor is not None:
+        return 86400.0 * year_conv * factor
+
+    raise ValueError(
+        str(units) + ' is not a valid unit, e.g. "s", "m", "h", "d" or "y".'
+    )
 
 
 def time_unit_conv(
@@ -149,46 +274,11 @@ def time_unit_conv(
 
     """
 
-    conv = {
-        "ps": 1.0e-12,
-        "ns": 1.0e-9,
-        "μs": 1.0e-6,
-        "us": 1.0e-6,
-        "ms": 1.0e-3,
-        "s": 1.0,
-        "m": 60.0,
-        "h": 3600.0,
-        "d": 86400.0,
-        "y": 86400.0 * year_conv,
-        "sec": 1,
-        "second": 1,
-        "seconds": 1,
-        "hr": 3600.0,
-        "hour": 3600.0,
-        "hours": 3600.0,
-        "day": 86400.0,
-        "days": 86400.0,
-        "yr": 86400.0 * year_conv,
-        "year": 86400.0 * year_conv,
-        "years": 86400.0 * year_conv,
-        "ky": 86400.0 * year_conv * 1.0e3,
-        "My": 86400.0 * year_conv * 1.0e6,
-        "By": 86400.0 * year_conv * 1.0e9,
-        "Gy": 86400.0 * year_conv * 1.0e9,
-        "Ty": 86400.0 * year_conv * 1.0e12,
-        "Py": 86400.0 * year_conv * 1.0e15,
-    }
-
-    if units_from not in conv:
-        raise ValueError(
-            str(units_from) + ' is not a valid unit, e.g. "s", "m", "h", "d" or "y".'
-        )
-    if units_to not in conv:
-        raise ValueError(
-            str(units_to) + ' is not a valid unit, e.g. "s", "m", "h", "d" or "y".'
-        )
-
-    return time_period * conv[units_from] / conv[units_to]
+    return (
+        time_period
+        * _time_unit_factor(units_from, year_conv)
+        / _time_unit_factor(units_to, year_conv)
+    )
 
 
 def time_unit_conv_sympy(
@@ -18,8 +18,27 @@ class Test(unittest.TestCase):
 
         nuc = Radionuclide("Rn-222")
         self.assertEqual(nuc.radionuclide, "Rn-222")
+        self.assertEqual(nuc.decay_constant, 2.0982180755947176e-06)
+        self.assertIs(type(nuc.decay_constant), float)
         self.assertEqual(nuc.prog_bf_mode, {"Po-218": [1.0, "\u03b1"]})
 
+        with self.assertRaises(ValueError):
+            Radionuclide("H-4")
+        with self.assertRaises(ValueError):
+            Radionuclide("Xx")
+
+    def test_radionuclide_many(self):
+        """
+        Test Radionuclide many() class method.
+        """
+
+        nucs = Radionuclide.many(["K-40", "222Rn"])
+        self.assertEqual(nucs, [Radionuclide("K-40"), Radionuclide("Rn-222")])
+        self.assertEqual(nucs[1].prog_bf_mode, {"Po-218": [1.0, "\u03b1"]})
+        self.assertEqual(nucs[1].half_life("d"), 3.8235)
+        with self.assertRaises(ValueError):
+            Radionuclide.many(["K-40", "H-2"])
+
     def test_radionuclide_half_life(self):
         """
         Test Radionuclide half_life() method.
@@ -30,6 +49,14 @@ class Test(unittest.TestCase):
         self.assertEqual(nuc.half_life("y"), 12.32)
         self.assertEqual(nuc.half_life("readable"), "12.32 y")
 
+        # Repeat conversions are returned from the cache, invalid units are not cached
+        half_life_d = nuc.half_life("d")
+        self.assertEqual(half_life_d, 4499.783904000001)
+        self.assertIs(nuc.half_life("d"), half_life_d)
+        with self.assertRaises(ValueError):
+            nuc.half_life("fortnight")
+        self.assertNotIn("fortnight", nuc._half_life_cache)
+
     def test_radionuclide_progeny(self):
         """
         Test Radionuclide half_life() method.
@@ -39,6 +66,10 @@ class Test(unittest.TestCase):
         self.assertEqual(nuc.progeny()[0], "Ca-40")
         self.assertEqual(nuc.progeny()[1], "Ar-40")
 
+        progeny = nuc.progeny()
+        progeny.append("H-3")
+        self.assertEqual(nuc.progeny(), ["Ca-40", "Ar-40"])
+
     def test_radionuclide_branching_fractions(self):
         """
         Test Radionuclide branching_fractions() method.
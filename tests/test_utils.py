@@ -26,6 +26,10 @@ class Test(unittest.TestCase):
         self.assertEqual(parse_nuclide("Ca40"), "Ca-40")
         self.assertEqual(parse_nuclide("40Ca"), "Ca-40")
 
+        # Catch erroneous inputs
+        with self.assertRaises(ValueError):
+            parse_nuclide(["H-3"])
+
     def test_parse_radionuclide(self):
         """
         Test the parsing of radionuclide strings.
@@ -107,6 +111,12 @@ class Test(unittest.TestCase):
         with self.assertRaises(ValueError):
             parse_radionuclide("Pbo-198m", radionuclides, dataset)
 
+        # Check with a dictionary of radionuclides for hashed membership checks
+        radionuclide_dict = dict.fromkeys(radionuclides)
+        self.assertEqual(parse_radionuclide("3H", radionuclide_dict, dataset), "H-3")
+        with self.assertRaises(ValueError):
+            parse_radionuclide("H-4", radionuclide_dict, dataset)
+
     def test_time_unit_conv_seconds(self):
         """
         Test function which converts between seconds and different time units.